@@ -21,6 +21,33 @@ class bitFlag:
             obj.micro.nvm[self.byte] &= ~self.bit_mask
 
 
+class shadowBitFlag:
+    """
+    Single bit register WITHIN a byte that can be read or set
+    values are 'bool'
+
+    Reads come from a RAM copy of the byte kept in obj._flag_shadow and
+    the NVM byte is only rewritten when its value actually changes
+
+    """
+
+    def __init__(self, register, bit):
+        self.bit_mask = 1 << (bit % 8)  # the bitmask *within* the byte!
+        self.byte = register
+
+    def __get__(self, obj, objtype=None):
+        return bool(obj._flag_shadow & self.bit_mask)
+
+    def __set__(self, obj, value):
+        if value:
+            reg = obj._flag_shadow | self.bit_mask
+        else:
+            reg = obj._flag_shadow & ~self.bit_mask
+        if reg != obj._flag_shadow:
+            obj._flag_shadow = reg
+            obj.micro.nvm[self.byte] = reg
+
+
 class multiBitFlag:
     """
     Multi-bit value WITHIN a byte that can be read or set
@@ -14,25 +14,18 @@ import digitalio, pwmio
 from debugcolor import co
 import gc
 
-# Hardware Specific Libs
-import neopixel  # RGB LED
-import adafruit_pca9685  # LED Driver
-import adafruit_tca9548a  # I2C Multiplexer
-import adafruit_pct2075  # Temperature Sensor
-import adafruit_ina219  # Power Monitor
+# Hardware Specific Libs (neopixel, PCA9685, TCA9548A, PCT2075, INA219 and the
+# thermocouple ADC) are imported inside their init blocks so a missing or
+# failed device does not keep its driver resident in RAM
 
 # CAN Bus Import
 from adafruit_mcp2515 import MCP2515 as CAN
 
 # Common CircuitPython Libs
 from os import listdir, stat, statvfs, mkdir, chdir
-from bitflags import bitFlag, multiBitFlag, multiByte
+from bitflags import bitFlag, shadowBitFlag, multiBitFlag, multiByte
 from micropython import const
 
-# Thermoucouple ADC
-import adafruit_ads1x15.ads1015 as ADS
-from adafruit_ads1x15.analog_in import AnalogIn
-
 # NVM register numbers
 _BOOTCNT = const(0)
 _VBUSRST = const(6)
@@ -42,8 +35,43 @@ _ICHRG = const(11)
 _DIST = const(13)
 _FLAG = const(16)
 
+# Hardware status bit numbers within Satellite._hw (faces fill the second byte)
+_HW_WDT = const(0)
+_HW_NEO = const(1)
+_HW_TCA = const(2)
+_HW_SOLAR = const(3)
+_HW_PWR = const(4)
+_HW_FLD = const(5)
+_HW_TEMP = const(6)
+_HW_COUPLE = const(7)
+_HW_FACE0 = const(8)
+_HW_CAN = const(13)
+_HW_FACES = const(0b11111)  # Face0-Face4 mask within _hw[1]
+
 SEND_BUFF = bytearray(252)
 
+# INA219 shunt and bus voltage register pointers and a shared read buffer
+_INA_SHUNT = b"\x01"
+_INA_BUS = b"\x02"
+_INA_BUF = bytearray(2)
+
+# Common burn wire duty cycles (%) as 16-bit PWM values
+_BURN_DUTY = {f: int(f * 0xFFFF / 100) for f in (0, 25, 50, 75, 100)}
+
+# debug_print color escapes and tag, split around the message once at import
+_DBG_HEAD, _DBG_TAIL = co("[BATTERY][Pysquared]\0", "red", "bold").split("\0")
+
+# Log tags shared by several exception handlers
+_T_FACE = (
+    "[WARNING][Face0]",
+    "[WARNING][Face1]",
+    "[WARNING][Face2]",
+    "[WARNING][Face3]",
+    "[WARNING][Face4]",
+)
+_T_PWR = "[WARNING][PWR Monitor]"
+_T_SOLAR = "[WARNING][SOLAR PWR Monitor]"
+
 
 class Satellite:
     # General NVM counters
@@ -53,53 +81,102 @@ class Satellite:
     c_distance = multiBitFlag(register=_DIST, lowest_bit=0, num_bits=8)
     c_ichrg = multiBitFlag(register=_ICHRG, lowest_bit=0, num_bits=8)
 
-    # Define NVM flags
-    f_softboot = bitFlag(register=_FLAG, bit=0)
-    f_solar = bitFlag(register=_FLAG, bit=1)
-    f_burnarm = bitFlag(register=_FLAG, bit=2)
-    f_brownout = bitFlag(register=_FLAG, bit=3)
-    f_triedburn = bitFlag(register=_FLAG, bit=4)
-    f_shtdwn = bitFlag(register=_FLAG, bit=5)
-    f_burned = bitFlag(register=_FLAG, bit=6)
-    f_fsk = bitFlag(register=_FLAG, bit=7)
+    # Define NVM flags (shadowed in RAM, see self._flag_shadow)
+    f_softboot = shadowBitFlag(register=_FLAG, bit=0)
+    f_solar = shadowBitFlag(register=_FLAG, bit=1)
+    f_burnarm = shadowBitFlag(register=_FLAG, bit=2)
+    f_brownout = shadowBitFlag(register=_FLAG, bit=3)
+    f_triedburn = shadowBitFlag(register=_FLAG, bit=4)
+    f_shtdwn = shadowBitFlag(register=_FLAG, bit=5)
+    f_burned = shadowBitFlag(register=_FLAG, bit=6)
+    f_fsk = shadowBitFlag(register=_FLAG, bit=7)
+
+    # Name to bit number for the hardware status view
+    _HW_BITS = {
+        "WDT": _HW_WDT,
+        "NEO": _HW_NEO,
+        "TCA": _HW_TCA,
+        "SOLAR": _HW_SOLAR,
+        "PWR": _HW_PWR,
+        "FLD": _HW_FLD,
+        "TEMP": _HW_TEMP,
+        "COUPLE": _HW_COUPLE,
+        "CAN": _HW_CAN,
+        "Face0": _HW_FACE0,
+        "Face1": _HW_FACE0 + 1,
+        "Face2": _HW_FACE0 + 2,
+        "Face3": _HW_FACE0 + 3,
+        "Face4": _HW_FACE0 + 4,
+    }
+
+    # Face channel order on the LED driver and the matching labels
+    _face_names = ("z+", "z-", "y+", "x-", "x+")
 
     # Turns all of the Faces On (Defined before init because this fuction is called by the init)
     def all_faces_on(self):
         # Faces MUST init in this order or the uController will brown out. Cause unknown
-        if self.hardware["FLD"]:
-            self.Face0.duty_cycle = 0xFFFF
-            self.hardware["Face0"] = True
-            self.Face1.duty_cycle = 0xFFFF
-            self.hardware["Face1"] = True
-            self.Face2.duty_cycle = 0xFFFF
-            self.hardware["Face2"] = True
-            self.Face3.duty_cycle = 0xFFFF
-            self.hardware["Face3"] = True
-            self.Face4.duty_cycle = 0xFFFF
-            self.hardware["Face4"] = True
+        if self._get_hw(_HW_FLD):
+            for ch in self._faces:
+                ch.duty_cycle = 0xFFFF
+            self._hw[1] |= _HW_FACES
 
     def all_faces_off(self):
         # De-Power Faces
-        if self.hardware["FLD"]:
-            self.Face0.duty_cycle = 0x0000
+        if self._get_hw(_HW_FLD):
+            for ch in self._faces:
+                ch.duty_cycle = 0x0000
+            self._hw[1] &= ~_HW_FACES
+            # The PCA9685 latches each write, only the last gate needs to discharge
             time.sleep(0.1)
-            self.hardware["Face0"] = False
-            self.Face1.duty_cycle = 0x0000
-            time.sleep(0.1)
-            self.hardware["Face1"] = False
-            self.Face2.duty_cycle = 0x0000
-            time.sleep(0.1)
-            self.hardware["Face2"] = False
-            self.Face3.duty_cycle = 0x0000
-            time.sleep(0.1)
-            self.hardware["Face3"] = False
-            self.Face4.duty_cycle = 0x0000
-            time.sleep(0.1)
-            self.hardware["Face4"] = False
+
+    def set_face(self, i, on):
+        if not self._get_hw(_HW_FLD):
+            self.debug_print("[WARNING] LED Driver not initialized")
+            return
+        try:
+            self._faces[i].duty_cycle = 0xFFFF if on else 0x0000
+            self._set_hw(_HW_FACE0 + i, on)
+            self.debug_print(
+                self._face_names[i]
+                + (" Face Powered On" if on else " Face Powered Off")
+            )
+        except Exception as e:
+            self._debug_exc(_T_FACE[i], e)
+            self._set_hw(_HW_FACE0 + i, False)
+
+    def _get_hw(self, bit):
+        return bool(self._hw[bit >> 3] & (1 << (bit & 7)))
+
+    def _set_hw(self, bit, value):
+        if value:
+            self._hw[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self._hw[bit >> 3] &= ~(1 << (bit & 7))
+
+    @property
+    def hardware(self):
+        # dict view of the packed status bits, for debug printing
+        return {k: self._get_hw(bit) for k, bit in self._HW_BITS.items()}
 
     def debug_print(self, statement):
         if self.debug:
-            print(co("[BATTERY][Pysquared]" + str(statement), "red", "bold"))
+            print(_DBG_HEAD, statement, _DBG_TAIL, sep="")
+
+    def _expect_i2c0(self, address):
+        # Devices missing from the boot scan raise here, before the driver retries
+        if self._i2c0_found is not None and address not in self._i2c0_found:
+            raise ValueError("No I2C device at address: 0x%x" % address)
+
+    def _gc_checkpoint(self, tag):
+        # Free init garbage between driver blocks so later allocations stay contiguous
+        gc.collect()
+        if self.debug:
+            self.debug_print(tag + " " + str(gc.mem_free()) + " Bytes free")
+
+    def _debug_exc(self, tag, e):
+        # Only format the traceback when it will actually be printed
+        if self.debug:
+            self.debug_print(tag + "".join(traceback.format_exception(e)))
 
     def __init__(self):
         """
@@ -108,7 +185,6 @@ class Satellite:
         self.debug = True  # Define verbose output here. True or False
         self.BOOTTIME = 1577836800
         self.debug_print(f"Boot time: {self.BOOTTIME}s")
-        self.CURRENTTIME = self.BOOTTIME
         self.UPTIME = 0
         self.heating = False
         self.NORMAL_TEMP = 20
@@ -119,69 +195,112 @@ class Satellite:
         self.CRITICAL_BATTERY_VOLTAGE = 6.6  # 6.6
         self.urate = 115200
         self.send_buff = memoryview(SEND_BUFF)
+        self._ina_cache = {}
         self.micro = microcontroller
-        self.hardware = {
-            "WDT": False,
-            "NEO": False,
-            "TCA": False,
-            "SOLAR": False,
-            "PWR": False,
-            "FLD": False,
-            "TEMP": False,
-            "COUPLE": False,
-            "CAN": False,
-            "Face0": False,
-            "Face1": False,
-            "Face2": False,
-            "Face3": False,
-            "Face4": False,
-        }
+        self._flag_shadow = self.micro.nvm[_FLAG]
+        self._hw = bytearray(2)  # packed hardware status, see _HW_BITS
+
+        # Collect before the heap fills up rather than after, to limit
+        # fragmentation while the drivers are allocated back-to-back
+        if hasattr(gc, "threshold"):
+            gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+
+        # Bind every pin once up front instead of a board lookup per use
+        b = board
+        burn_relay_a, burn_enable, vbus_reset, i2c_reset, is_charging = (
+            b.BURN_RELAY_A,
+            b.BURN_ENABLE,
+            b.VBUS_RESET,
+            b.I2C_RESET,
+            b.IS_CHARGING,
+        )
+        i2c0_scl, i2c0_sda, i2c1_scl, i2c1_sda = (
+            b.I2C0_SCL,
+            b.I2C0_SDA,
+            b.I2C1_SCL,
+            b.I2C1_SDA,
+        )
+        spi0_sck, spi0_mosi, spi0_miso, spi0_cs0 = (
+            b.SPI0_SCK,
+            b.SPI0_MOSI,
+            b.SPI0_MISO,
+            b.SPI0_CS0,
+        )
+        spi1_sck, spi1_mosi, spi1_miso, spi1_cs0 = (
+            b.SPI1_SCK,
+            b.SPI1_MOSI,
+            b.SPI1_MISO,
+            b.SPI1_CS0,
+        )
+        tx, rx, rf_enable, neo_pwr, neopixel_pin = (
+            b.TX,
+            b.RX,
+            b.RF_ENABLE,
+            b.NEO_PWR,
+            b.NEOPIXEL,
+        )
 
         # Define burn wires:
-        self._relayA = digitalio.DigitalInOut(board.BURN_RELAY_A)
+        self._relayA = digitalio.DigitalInOut(burn_relay_a)
         self._relayA.switch_to_output(drive_mode=digitalio.DriveMode.OPEN_DRAIN)
-        self._resetReg = digitalio.DigitalInOut(board.VBUS_RESET)
+        self._resetReg = digitalio.DigitalInOut(vbus_reset)
         self._resetReg.switch_to_output(drive_mode=digitalio.DriveMode.OPEN_DRAIN)
 
-        # Define SPI,I2C,UART | paasing I2C1 to BigData
+        # Burn wire PWM is allocated once and idles at 0% duty cycle
         try:
-            self.i2c0 = busio.I2C(board.I2C0_SCL, board.I2C0_SDA, timeout=5)
-            self.spi0 = busio.SPI(board.SPI0_SCK, board.SPI0_MOSI, board.SPI0_MISO)
-            self.i2c1 = busio.I2C(
-                board.I2C1_SCL, board.I2C1_SDA, timeout=5, frequency=100000
+            self._burn_pwm = pwmio.PWMOut(
+                burn_enable, frequency=1000, duty_cycle=0, variable_frequency=True
             )
-            self.spi1 = busio.SPI(board.SPI1_SCK, board.SPI1_MOSI, board.SPI1_MISO)
-            self.uart = busio.UART(board.TX, board.RX, baudrate=self.urate)
         except Exception as e:
-            self.debug_print(
-                "ERROR INITIALIZING BUSSES: " + "".join(traceback.format_exception(e))
-            )
+            self._burn_pwm = None
+            self._debug_exc("[ERROR][Burn Wire PWM]", e)
+        self._gc_checkpoint("[Burn Wire PWM]")
+
+        # Define SPI,I2C,UART | paasing I2C1 to BigData
+        try:
+            self.i2c0 = busio.I2C(i2c0_scl, i2c0_sda, timeout=5, frequency=400000)
+            self.spi0 = busio.SPI(spi0_sck, spi0_mosi, spi0_miso)
+            self.i2c1 = busio.I2C(i2c1_scl, i2c1_sda, timeout=5, frequency=100000)
+            self.spi1 = busio.SPI(spi1_sck, spi1_mosi, spi1_miso)
+            self.uart = busio.UART(tx, rx, baudrate=self.urate)
+        except Exception as e:
+            self._debug_exc("ERROR INITIALIZING BUSSES: ", e)
+        self._gc_checkpoint("[Busses]")
+
+        # Scan I2C0 once so absent devices fail fast instead of timing out
+        self._i2c0_found = None
+        try:
+            if self.i2c0.try_lock():
+                try:
+                    self._i2c0_found = self.i2c0.scan()
+                finally:
+                    self.i2c0.unlock()
+        except Exception as e:
+            self._debug_exc("[WARNING][I2C0 Scan]", e)
 
         # Initialize LED Driver
         try:
+            self._expect_i2c0(0x56)
+            import adafruit_pca9685  # LED Driver
+
             self.faces = adafruit_pca9685.PCA9685(self.i2c0, address=int(0x56))
             self.faces.frequency = 2000
-            self.hardware["FLD"] = True
+            self._set_hw(_HW_FLD, True)
         except Exception as e:
-            self.debug_print(
-                "[ERROR][LED Driver]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][LED Driver]", e)
+        self._gc_checkpoint("[LED Driver]")
 
         # Initialize all of the Faces and their sensors
         try:
-            self.Face0 = self.faces.channels[0]
-            self.Face1 = self.faces.channels[1]
-            self.Face2 = self.faces.channels[2]
-            self.Face3 = self.faces.channels[3]
-            self.Face4 = self.faces.channels[4]
+            self._faces = tuple(self.faces.channels[i] for i in range(5))
+            self.Face0, self.Face1, self.Face2, self.Face3, self.Face4 = self._faces
             self.all_faces_on()
         except Exception as e:
-            self.debug_print(
-                "ERROR INITIALIZING FACES: " + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("ERROR INITIALIZING FACES: ", e)
+        self._gc_checkpoint("[Faces]")
 
         # Define I2C Reset
-        self._i2c_reset = digitalio.DigitalInOut(board.I2C_RESET)
+        self._i2c_reset = digitalio.DigitalInOut(i2c_reset)
         self._i2c_reset.switch_to_output(value=True)
 
         if self.c_boot > 200:
@@ -191,8 +310,8 @@ class Satellite:
             self.f_softboot = False
 
         # Define radio
-        _rf_cs1 = digitalio.DigitalInOut(board.SPI0_CS0)
-        self.enable_rf = digitalio.DigitalInOut(board.RF_ENABLE)
+        _rf_cs1 = digitalio.DigitalInOut(spi0_cs0)
+        self.enable_rf = digitalio.DigitalInOut(rf_enable)
 
         # self.enable_rf.switch_to_output(value=False) # if U21
         self.enable_rf.switch_to_output(value=True)  # if U7
@@ -200,94 +319,111 @@ class Satellite:
 
         # Define Heater Pins
         try:
-            if self.hardware["FLD"]:
+            if self._get_hw(_HW_FLD):
                 self.heater = self.faces.channels[15]
         except Exception as e:
-            self.debug_print(
-                "[WARNING][Battery_Heater]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[WARNING][Battery_Heater]", e)
 
         # Initialize Neopixel
         try:
-            self.neopwr = digitalio.DigitalInOut(board.NEO_PWR)
+            import neopixel  # RGB LED
+
+            self.neopwr = digitalio.DigitalInOut(neo_pwr)
             self.neopwr.switch_to_output(value=True)
             self.neopixel = neopixel.NeoPixel(
-                board.NEOPIXEL, 1, brightness=0.2, pixel_order=neopixel.GRB
+                neopixel_pin, 1, brightness=0.2, pixel_order=neopixel.GRB
             )
             self.neopixel[0] = (0, 0, 255)
-            self.hardware["NEO"] = True
+            self._set_hw(_HW_NEO, True)
         except Exception as e:
-            self.debug_print(
-                "[WARNING][Neopixel]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[WARNING][Neopixel]", e)
+        self._gc_checkpoint("[Neopixel]")
 
         # Initialize Power Monitor
         try:
+            self._expect_i2c0(0x40)
+            import adafruit_ina219  # Power Monitor
+
             time.sleep(1)
             self.pwr = adafruit_ina219.INA219(self.i2c0, addr=int(0x40))
-            self.hardware["PWR"] = True
+            self._set_hw(_HW_PWR, True)
         except Exception as e:
-            self.debug_print(
-                "[ERROR][Power Monitor]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][Power Monitor]", e)
+        self._gc_checkpoint("[Power Monitor]")
 
         # Initialize Solar Power Monitor
         try:
+            self._expect_i2c0(0x44)
+            import adafruit_ina219  # Power Monitor
+
             time.sleep(1)
             self.solar = adafruit_ina219.INA219(self.i2c0, addr=int(0x44))
-            self.hardware["SOLAR"] = True
+            self._set_hw(_HW_SOLAR, True)
         except Exception as e:
-            self.debug_print(
-                "[ERROR][SOLAR Power Monitor]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][SOLAR Power Monitor]", e)
+        self._gc_checkpoint("[SOLAR Power Monitor]")
 
         # Define Charge Indicate Pin
-        self.charge_indicate = digitalio.DigitalInOut(board.IS_CHARGING)
+        self.charge_indicate = digitalio.DigitalInOut(is_charging)
         self.charge_indicate.switch_to_input(pull=digitalio.Pull.DOWN)
 
         # Initialize PCT2075 Temperature Sensor
         try:
+            self._expect_i2c0(0x4F)
+            import adafruit_pct2075  # Temperature Sensor
+
             self.pct = adafruit_pct2075.PCT2075(self.i2c0, address=0x4F)
-            self.hardware["TEMP"] = True
+            self._set_hw(_HW_TEMP, True)
         except Exception as e:
-            self.debug_print(
-                "[ERROR][TEMP SENSOR]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][TEMP SENSOR]", e)
+        self._gc_checkpoint("[TEMP SENSOR]")
 
         # Initialize Thermocouple ADC
         try:
+            self._expect_i2c0(0x48)
+            import adafruit_ads1x15.ads1015 as ADS  # Thermocouple ADC
+            from adafruit_ads1x15.analog_in import AnalogIn
+
             self.thermocouple = ADS.ADS1015(self.i2c0, address=0x48)
-            self.hardware["COUPLE"] = True
+            self._tc_chan = AnalogIn(self.thermocouple, ADS.P1)
+            self._set_hw(_HW_COUPLE, True)
             self.debug_print("[ACTIVE][Thermocouple]")
         except Exception as e:
-            self.debug_print(
-                "[ERROR][THERMOCOUPLE]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][THERMOCOUPLE]", e)
+        self._gc_checkpoint("[THERMOCOUPLE]")
 
         # Initialize TCA
         try:
+            self._expect_i2c0(0x77)
+            import adafruit_tca9548a  # I2C Multiplexer
+
             self.tca = adafruit_tca9548a.TCA9548A(self.i2c0, address=int(0x77))
-            for channel in range(8):
-                if self.tca[channel].try_lock():
-                    self.debug_print("Channel {}:".format(channel))
-                    addresses = self.tca[channel].scan()
-                    print([hex(address) for address in addresses if address != 0x70])
-                    self.tca[channel].unlock()
-            self.hardware["TCA"] = True
+            # The channel scan is diagnostic only (Big_Data probes the face
+            # sensors itself), so skip its ~100ms per channel unless debugging
+            if self.debug:
+                for channel in range(8):
+                    if self.tca[channel].try_lock():
+                        self.debug_print("Channel {}:".format(channel))
+                        addresses = self.tca[channel].scan()
+                        print(
+                            [hex(address) for address in addresses if address != 0x70]
+                        )
+                        self.tca[channel].unlock()
+            self._set_hw(_HW_TCA, True)
         except Exception as e:
-            self.debug_print("[ERROR][TCA]" + "".join(traceback.format_exception(e)))
+            self._debug_exc("[ERROR][TCA]", e)
+        self._gc_checkpoint("[TCA]")
 
         # Initialize CAN Transceiver
         try:
-            self.spi1cs0 = digitalio.DigitalInOut(board.SPI1_CS0)
+            self.spi1cs0 = digitalio.DigitalInOut(spi1_cs0)
             self.spi1cs0.switch_to_output()
             self.can_bus = CAN(self.spi1, self.spi1cs0, loopback=True, silent=True)
-            self.hardware["CAN"] = True
+            self._set_hw(_HW_CAN, True)
 
         except Exception as e:
-            self.debug_print(
-                "[ERROR][CAN TRANSCEIVER]" + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("[ERROR][CAN TRANSCEIVER]", e)
+        self._gc_checkpoint("[CAN TRANSCEIVER]")
 
         # Prints init state of PySquared hardware
         self.debug_print(str(self.hardware))
@@ -312,11 +448,11 @@ class Satellite:
 
     @RGB.setter
     def RGB(self, value):
-        if self.hardware["NEO"]:
+        if self._get_hw(_HW_NEO):
             try:
                 self.neopixel[0] = value
             except Exception as e:
-                self.debug_print("[ERROR]" + "".join(traceback.format_exception(e)))
+                self._debug_exc("[ERROR]", e)
         else:
             self.debug_print("[WARNING] neopixel not initialized")
 
@@ -369,169 +505,110 @@ class Satellite:
     # =======================================================#
     @property
     def Face0_state(self):
-        return self.hardware["Face0"]
+        return self._get_hw(_HW_FACE0)
 
     @Face0_state.setter
     def Face0_state(self, value):
-        if self.hardware["FLD"]:
-            if value:
-                try:
-                    self.Face0 = 0xFFFF
-                    self.hardware["Face0"] = True
-                    self.debug_print("z Face Powered On")
-                except Exception as e:
-                    self.debug_print(
-                        "[WARNING][Face0]" + "".join(traceback.format_exception(e))
-                    )
-                    self.hardware["Face0"] = False
-            else:
-                self.Face0 = 0x0000
-                self.hardware["Face0"] = False
-                self.debug_print("z+ Face Powered Off")
-        else:
-            self.debug_print("[WARNING] LED Driver not initialized")
+        self.set_face(0, value)
 
     @property
     def Face1_state(self):
-        return self.hardware["Face1"]
+        return self._get_hw(_HW_FACE0 + 1)
 
     @Face1_state.setter
     def Face1_state(self, value):
-        if self.hardware["FLD"]:
-            if value:
-                try:
-                    self.Face1 = 0xFFFF
-                    self.hardware["Face1"] = True
-                    self.debug_print("z- Face Powered On")
-                except Exception as e:
-                    self.debug_print(
-                        "[WARNING][Face1]" + "".join(traceback.format_exception(e))
-                    )
-                    self.hardware["Face1"] = False
-            else:
-                self.Face1 = 0x0000
-                self.hardware["Face1"] = False
-                self.debug_print("z- Face Powered Off")
-        else:
-            self.debug_print("[WARNING] LED Driver not initialized")
+        self.set_face(1, value)
 
     @property
     def Face2_state(self):
-        return self.hardware["Face2"]
+        return self._get_hw(_HW_FACE0 + 2)
 
     @Face2_state.setter
     def Face2_state(self, value):
-        if self.hardware["FLD"]:
-            if value:
-                try:
-                    self.Face2 = 0xFFFF
-                    self.hardware["Face2"] = True
-                    self.debug_print("y+ Face Powered On")
-                except Exception as e:
-                    self.debug_print(
-                        "[WARNING][Face2]" + "".join(traceback.format_exception(e))
-                    )
-                    self.hardware["Face2"] = False
-            else:
-                self.Face2 = 0x0000
-                self.hardware["Face2"] = False
-                self.debug_print("y+ Face Powered Off")
-        else:
-            self.debug_print("[WARNING] LED Driver not initialized")
+        self.set_face(2, value)
 
     @property
     def Face3_state(self):
-        return self.hardware["Face3"]
+        return self._get_hw(_HW_FACE0 + 3)
 
     @Face3_state.setter
     def Face3_state(self, value):
-        if self.hardware["FLD"]:
-            if value:
-                try:
-                    self.Face3 = 0xFFFF
-                    self.hardware["Face3"] = True
-                    self.debug_print("x- Face Powered On")
-                except Exception as e:
-                    self.debug_print(
-                        "[WARNING][Face3]" + "".join(traceback.format_exception(e))
-                    )
-                    self.hardware["Face3"] = False
-            else:
-                self.Face3 = 0x0000
-                self.hardware["Face3"] = False
-                self.debug_print("x- Face Powered Off")
-        else:
-            self.debug_print("[WARNING] LED Driver not initialized")
+        self.set_face(3, value)
 
     @property
     def Face4_state(self):
-        return self.hardware["Face4"]
+        return self._get_hw(_HW_FACE0 + 4)
 
     @Face4_state.setter
     def Face4_state(self, value):
-        if self.hardware["FLD"]:
-            if value:
-                try:
-                    self.Face4 = 0xFFFF
-                    self.hardware["Face4"] = True
-                    self.debug_print("x+ Face Powered On")
-                except Exception as e:
-                    self.debug_print(
-                        "[WARNING][Face4]" + "".join(traceback.format_exception(e))
-                    )
-                    self.hardware["Face4"] = False
-            else:
-                self.Face4 = 0x0000
-                self.hardware["Face4"] = False
-                self.debug_print("x+ Face Powered Off")
-        else:
-            self.debug_print("[WARNING] LED Driver not initialized")
+        self.set_face(4, value)
 
     # =======================================================#
     # Getters for State of Health Monitoring                #
     # =======================================================#
+    def _read_ina_raw(self, dev):
+        """
+        Reads the shunt and bus voltage registers of an INA219 under one bus lock.
+        The INA219 does not auto-increment its register pointer, so this is two
+        back-to-back reads rather than one 4 byte read. Returns (bus V, shunt V).
+        """
+        buf = _INA_BUF
+        with dev.i2c_device as i2c:
+            i2c.write_then_readinto(_INA_SHUNT, buf)
+            shunt = (buf[0] << 8) | buf[1]
+            i2c.write_then_readinto(_INA_BUS, buf)
+        if shunt & 0x8000:
+            shunt -= 0x10000
+        # Drop CNVR and OVF from the bus register, 4mV and 10uV LSBs
+        return (((buf[0] << 8) | buf[1]) >> 3) * 0.004, shunt * 0.00001
+
+    def _sample_ina(self, dev, n=16):
+        """
+        Averages n sweeps of the bus, shunt and current registers of an INA219.
+        Sweeps are cached for 50ms so back-to-back getters share one read.
+        """
+        t = time.monotonic_ns() // 50_000_000
+        cached = self._ina_cache.get(dev)
+        if cached is not None and cached[0] == t:
+            return cached[1]
+        v = sv = i = 0.0
+        for _ in range(n):
+            bv, sh = self._read_ina_raw(dev)
+            v += bv
+            sv += sh
+            i += dev.current
+        tup = (v / n, sv / n, i / n)
+        self._ina_cache[dev] = (t, tup)
+        return tup
+
     @property
     def battery_voltage(self):
-        if self.hardware["PWR"]:
-            voltage = 0
+        if self._get_hw(_HW_PWR):
             try:
-                for _ in range(50):
-                    voltage += self.pwr.bus_voltage
-                return voltage / 50 + 0.2  # volts and corection factor
+                return self._sample_ina(self.pwr)[0] + 0.2  # volts and corection factor
             except Exception as e:
-                self.debug_print(
-                    "[WARNING][PWR Monitor]" + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc(_T_PWR, e)
         else:
             self.debug_print("[WARNING] Power monitor not initialized")
 
     @property
     def system_voltage(self):
-        if self.hardware["PWR"]:
-            voltage = 0
+        if self._get_hw(_HW_PWR):
             try:
-                for _ in range(50):
-                    voltage += self.pwr.bus_voltage + self.pwr.shunt_voltage
-                return voltage / 50  # volts
+                tup = self._sample_ina(self.pwr)
+                return tup[0] + tup[1]  # volts
             except Exception as e:
-                self.debug_print(
-                    "[WARNING][PWR Monitor]" + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc(_T_PWR, e)
         else:
             self.debug_print("[WARNING] Power monitor not initialized")
 
     @property
     def current_draw(self):
-        if self.hardware["PWR"]:
-            idraw = 0
+        if self._get_hw(_HW_PWR):
             try:
-                for _ in range(50):  # average 50 readings
-                    idraw += self.pwr.current
-                return idraw / 50
+                return self._sample_ina(self.pwr)[2]
             except Exception as e:
-                self.debug_print(
-                    "[WARNING][PWR Monitor]" + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc(_T_PWR, e)
         else:
             self.debug_print("[WARNING] Power monitor not initialized")
 
@@ -541,40 +618,29 @@ class Satellite:
 
     @property
     def charge_voltage(self):
-        if self.hardware["SOLAR"]:
-            voltage = 0
+        if self._get_hw(_HW_SOLAR):
             try:
-                for _ in range(50):
-                    voltage += self.solar.bus_voltage
-                return voltage / 50 + 0.2  # volts and corection factor
+                return (
+                    self._sample_ina(self.solar)[0] + 0.2
+                )  # volts and corection factor
             except Exception as e:
-                self.debug_print(
-                    "[WARNING][SOLAR PWR Monitor]"
-                    + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc(_T_SOLAR, e)
         else:
             self.debug_print("[WARNING] SOLAR Power monitor not initialized")
 
     @property
     def charge_current(self):
-        if self.hardware["SOLAR"]:
-            ichrg = 0
+        if self._get_hw(_HW_SOLAR):
             try:
-                for _ in range(50):  # average 50 readings
-                    ichrg += self.solar.current
-                return ichrg / 50
+                return self._sample_ina(self.solar)[2]
             except Exception as e:
-                self.debug_print(
-                    "[WARNING][SOLAR PWR Monitor]"
-                    + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc(_T_SOLAR, e)
         else:
             self.debug_print("[WARNING] SOLAR Power monitor not initialized")
 
     @property
     def uptime(self):
-        self.CURRENTTIME = const(time.time())
-        return self.CURRENTTIME - self.BOOTTIME
+        return time.time() - self.BOOTTIME
 
     @property
     def reset_vbus(self):
@@ -582,9 +648,7 @@ class Satellite:
             self._resetReg.drive_mode = digitalio.DriveMode.PUSH_PULL
             self._resetReg.value = 1
         except Exception as e:
-            self.debug_print(
-                "vbus reset error: " + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("vbus reset error: ", e)
 
     # =======================================================#
     # Thermal Management                                    #
@@ -595,15 +659,13 @@ class Satellite:
 
     @property
     def battery_temperature(self):
-        if self.hardware["COUPLE"]:
-            chan = AnalogIn(self.thermocouple, ADS.P1)
-            tip = (chan.voltage - 1.25) / 0.005
-            return tip
+        if self._get_hw(_HW_COUPLE):
+            return (self._tc_chan.voltage - 1.25) * 200.0  # 5mV/C
         else:
             self.debug_print("[WARNING] Thermocouple not initialized")
 
     def heater_on(self):
-        if self.hardware["FLD"]:
+        if self._get_hw(_HW_FLD):
             try:
                 self._relayA.drive_mode = digitalio.DriveMode.PUSH_PULL
                 if self.f_brownout:
@@ -617,16 +679,13 @@ class Satellite:
                     time.sleep(0.25)
                     self.heater.duty_cycle = 0x7FFF
             except Exception as e:
-                self.debug_print(
-                    "[ERROR] Cant turn on heater: "
-                    + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc("[ERROR] Cant turn on heater: ", e)
                 self.heater.duty_cycle = 0x0000
         else:
             self.debug_print("[WARNING] LED Driver not initialized")
 
     def heater_off(self):
-        if self.hardware["FLD"]:
+        if self._get_hw(_HW_FLD):
             try:
                 self.heater.duty_cycle = 0x0000
                 self._relayA.value = 0
@@ -637,10 +696,7 @@ class Satellite:
                     self.debug_print("Battery Heater off!")
                     self.RGB = (0, 0, 0)
             except Exception as e:
-                self.debug_print(
-                    "[ERROR] Cant turn off heater: "
-                    + "".join(traceback.format_exception(e))
-                )
+                self._debug_exc("[ERROR] Cant turn off heater: ", e)
                 self.heater.duty_cycle = 0x0000
         else:
             self.debug_print("[WARNING] LED Driver not initialized")
@@ -658,21 +714,23 @@ class Satellite:
         freq:      (float) frequency in Hz of the PWM pulse, default is 1000 Hz
         duration:  (float) duration in seconds the burn wire should be on
         """
+        burnwire = self._burn_pwm
+        if burnwire is None or "1" not in str(burn_num):
+            return False
         try:
             # convert duty cycle % into 16-bit fractional up time
-            dtycycl = int((dutycycle / 100) * (0xFFFF))
+            dtycycl = _BURN_DUTY.get(dutycycle)
+            if dtycycl is None:
+                dtycycl = int((dutycycle / 100) * (0xFFFF))
             self.debug_print("----- BURN WIRE CONFIGURATION -----")
             self.debug_print(
                 "\tFrequency of: {}Hz\n\tDuty cycle of: {}% (int:{})\n\tDuration of {}sec".format(
                     freq, (100 * dtycycl / 0xFFFF), dtycycl, duration
                 )
             )
-            # create our PWM object for the respective pin
-            # not active since duty_cycle is set to 0 (for now)
-            if "1" in burn_num:
-                burnwire = pwmio.PWMOut(board.BURN_ENABLE, frequency=freq, duty_cycle=0)
-            else:
-                return False
+            # PWM is idle at 0% duty cycle, only retune it when needed
+            if burnwire.frequency != freq:
+                burnwire.frequency = freq
             # Configure the relay control pin & open relay
             self._relayA.drive_mode = digitalio.DriveMode.PUSH_PULL
             self._relayA.value = 1
@@ -687,19 +745,15 @@ class Satellite:
             self._relayA.value = 0
             burnwire.duty_cycle = 0
             self.RGB = (0, 0, 0)
-            # burnwire.deinit()
             self._relayA.drive_mode = digitalio.DriveMode.OPEN_DRAIN
             return True
         except Exception as e:
-            self.debug_print(
-                "Error with Burn Wire: " + "".join(traceback.format_exception(e))
-            )
+            self._debug_exc("Error with Burn Wire: ", e)
             return False
         finally:
             self._relayA.value = 0
             burnwire.duty_cycle = 0
             self.RGB = (0, 0, 0)
-            burnwire.deinit()
             self._relayA.drive_mode = digitalio.DriveMode.OPEN_DRAIN
 
 
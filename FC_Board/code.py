@@ -9,6 +9,7 @@ Published: July 26, 2024
 """
 
 import time
+import supervisor
 
 print("=" * 70)
 print("Hello World!")
@@ -17,9 +18,10 @@ print("Published: July 26, 2024")
 print("=" * 70)
 
 try:
-    for i in range(10):
-        print(f"Code Starting in {10-i} seconds")
-        time.sleep(1)
+    # Only loiter for a keyboard interrupt when a ground station is attached
+    if supervisor.runtime.usb_connected:
+        print("Code Starting in 10 seconds")
+        time.sleep(10)
 
     import main
 
@@ -82,7 +82,6 @@ class Satellite:
         """
         self.BOOTTIME = 1577836800
         self.debug_print(f"Boot time: {self.BOOTTIME}s")
-        self.CURRENTTIME = self.BOOTTIME
         self.UPTIME = 0
 
         """
@@ -421,8 +420,7 @@ class Satellite:
 
     @property
     def uptime(self):
-        self.CURRENTTIME = const(time.time())
-        return self.CURRENTTIME - self.BOOTTIME
+        return time.time() - self.BOOTTIME
 
     @property
     def reset_vbus(self):